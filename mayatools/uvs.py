@@ -4,78 +4,160 @@ import logging
 import maya.cmds as mc
 from maya.api import OpenMaya as om2
 
-from . import dg
-
 
 logger = logging.getLogger(__name__)
 
+try:
+    from typing import Union
+except:
+    pass
+
 
-# Safer if you used om2.MObjectHandle to store your MObject ...
 class UVActions(object):
 
     def __init__(self, mobj):
         # type: (om2.MObject) ->None
-        self._MObject = mobj
+        self._MObjectHandle = om2.MObjectHandle(mobj)
+        self._MDagPath = om2.MDagPath.getAPathTo(mobj)
+        self._MFnMesh = None
+        self._uvsets_cache = None
+        self._uvsets_set_cache = None
+
+    def _clear_uvsets_cache(self):
+        self._uvsets_cache = None
+        self._uvsets_set_cache = None
+
+    def _validate(self):
+        # type: () -> None
+        """Raise if the mesh was deleted since this UVActions was created, re-resolve its path if it was moved."""
+        handle = self._MObjectHandle
+        if not (handle.isValid() and handle.isAlive()):
+            self._MFnMesh = None
+            raise RuntimeError('Mesh of this UVActions is no longer valid.')
+
+        if not self._MDagPath.isValid():
+            self._MDagPath = om2.MDagPath.getAPathTo(handle.object())
+            self._MFnMesh = None
 
     def uvset_copy(self, src_uvset, dest_uvset, createNewMap=False):
         # type: (str, str, bool) -> None
+        self._validate()
         mc.polyCopyUV(self.fullpath, createNewMap=createNewMap, ch=False,
                         uvSetNameInput=src_uvset, uvSetName=dest_uvset)
-        logger.info('Copied uv set "{}" to "{}"...'.format(src_uvset, dest_uvset))
+        self._clear_uvsets_cache()
+        logger.info('Copied uv set "%s" to "%s"...', src_uvset, dest_uvset)
 
     def uvset_current_switch(self, uvset):
+        self._validate()
+        self._uvset_current_switch(uvset)
+
+    def _uvset_current_switch(self, uvset):
         mc.polyUVSet(self.fullpath, currentUVSet=True, uvSet=uvset)
 
     def uvset_exists(self, uvset):
         # type: (str) -> bool
-        is_uvset = uvset in self.uvsets
+        self._validate()
+        is_uvset = uvset in self._uvsets_set
         return is_uvset
 
     def uvset_delete(self, uvset):
         # type: (str) -> None
+        self._validate()
 
-        if self.uvset_exists(uvset):
-            self.uvset_current_switch(self.uvset_default)
-            mc.polyUVSet(self.fullpath, delete=True, uvSet=uvset)
-            msg = 'Removed uv set "{}" from mesh "{}".'
+        fullpath = self.fullpath
+
+        if uvset in self._uvsets_set:
+            self._uvset_current_switch(self._uvset_default)
+            mc.polyUVSet(fullpath, delete=True, uvSet=uvset)
+            self._clear_uvsets_cache()
+            msg = 'Removed uv set "%s" from mesh "%s".'
 
         else:
-            msg = 'Removal of uv set "{}" from mesh "{}" skipped - doesnt exist.'
+            msg = 'Removal of uv set "%s" from mesh "%s" skipped - doesnt exist.'
 
-        logger.info(msg.format(uvset, self.fullpath))
+        logger.info(msg, uvset, fullpath)
 
     # --- Properties -----------------------------------------------------------
 
     @property
     def uvsets(self):
         # type: () -> typing.Iterable(str)
-        indices = mc.polyUVSet(self.fullpath, query=True, allUVSetsIndices=True)
-
-        uvsets = []
-        for ii in indices:
-            node_attr = "{}.uvSet[{}].uvSetName".format(self.fullpath, ii)
-            uvsets.append(mc.getAttr(node_attr))
+        self._validate()
+        return self._uvsets
 
-        return uvsets
+    @property
+    def uvsets_set(self):
+        # type: () -> typing.FrozenSet(str)
+        self._validate()
+        return self._uvsets_set
 
     @property
     def uvset_default(self):
         """Return the assumed Maya "default UV set" for this mesh."""
-        if len(self.uvsets):
-            return self.uvsets[0]
+        self._validate()
+        return self._uvset_default
+
+    # Unvalidated versions of the above, for use once an entry point has called `_validate()`.
+
+    @property
+    def _uvsets(self):
+        # type: () -> typing.Iterable(str)
+        if self._uvsets_cache is None:
+            self._uvsets_cache = self.mfn_mesh.getUVSetNames()
+
+        return self._uvsets_cache
+
+    @property
+    def _uvsets_set(self):
+        # type: () -> typing.FrozenSet(str)
+        if self._uvsets_set_cache is None:
+            self._uvsets_set_cache = frozenset(self._uvsets)
+
+        return self._uvsets_set_cache
+
+    @property
+    def _uvset_default(self):
+        # type: () -> str
+        uvsets = self._uvsets
+        if uvsets:
+            return uvsets[0]
 
         else:
             raise RuntimeError('No UV sets could be found on "{}"'.format(self.fullpath))
 
+    @property
+    def mfn_mesh(self):
+        # type: () -> om2.MFnMesh
+        if self._MFnMesh is None:
+            self._MFnMesh = om2.MFnMesh(self._MDagPath)
+
+        return self._MFnMesh
+
     @property
     def uvs(self):
-        return get_mesh_uvs(self.fullpath)
+        self._validate()
+        return _mesh_uvs(self.fullpath, self.mfn_mesh.numUVs())
 
     @property
     def fullpath(self):
-        return dg.getFullpath(self._MObject)
+        return self._MDagPath.fullPathName()
+
+
+def get_mesh_uvs(mesh):
+    # type: (Union[str, om2.MDagPath, om2.MObject]) -> str
+    """Return the component name covering all the uvs of `mesh` (e.g. '|pCube1|pCubeShape1.map[0:13]')."""
+    if isinstance(mesh, basestring):
+        mesh = om2.MSelectionList().add(mesh).getDagPath(0)
+
+    elif isinstance(mesh, om2.MObject):
+        mesh = om2.MDagPath.getAPathTo(mesh)
+
+    return _mesh_uvs(mesh.fullPathName(), om2.MFnMesh(mesh).numUVs())
+
 
+def _mesh_uvs(fullpath, num_uvs):
+    # type: (str, int) -> str
+    if not num_uvs:
+        raise RuntimeError('No UVs could be found on "{}"'.format(fullpath))
 
-def get_mesh_uvs(fullpath):
-    uvs = mc.polyEvaluate(fullpath, uv=True)
-    return '{}.map[0:{}]'.format(fullpath, uvs)
+    return '{}.map[0:{}]'.format(fullpath, num_uvs - 1)
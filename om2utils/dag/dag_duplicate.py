@@ -17,6 +17,8 @@ class HierarchyDuplicator(object):
     def __init__(self, source_path):
 
         self._source_path = source_path
+        self._source_mobjhandle = om2.MObjectHandle(dg_utils.as_mObject(source_path))
+        self._source_is_valid = self._validate_source()
         self._destination_path = None
         self._replace = True
         self._new_name = None
@@ -30,7 +32,8 @@ class HierarchyDuplicator(object):
 
         if mc.objExists(dest_path) and self._replace:
             mc.delete(dest_path)
-            logger.info('Deleted existing node at path: "{}".'.format(dest_path))
+            self._source_is_valid = self._validate_source()
+            logger.info('Deleted existing node at path: "%s".', dest_path)
 
     def _duplicate(self, *args, **kwargs):
 
@@ -38,49 +41,62 @@ class HierarchyDuplicator(object):
         self._result_mobj = dg_utils.as_mObject(duplicate_path)
         return self._result_mobj
 
-    def duplicate(self):
-
+    def duplicate(self, md=None):
+        # type: (om2.MDagModifier) -> None
+        # If `md` is given, edits are only queued on it and the caller must call `doIt()`.
         self._setup()
         self._duplicate()
 
         if self._new_name:
-            self.rename(self._new_name)
+            self.rename(self._new_name, md)
 
     def duplicate_under_same_parent(self):
 
         parent = self._source_dagpath.parent
 
-        self.duplicate()
-        return self._parent_under(parent)
+        md = om2.MDagModifier()
+        self.duplicate(md)
+        self._parent_under(parent, md)
+        self._do_it(md)
 
-    def _parent_under(self, parent_path):
-        # type: (str) -> None
+    def _parent_under(self, parent_path, md=None):
+        # type: (str, om2.MDagModifier) -> None
 
         parent = dg_utils.as_mObject(parent_path)
+        do_it = md is None
+        md = om2.MDagModifier() if do_it else md
 
-        md = om2.MDagModifier()
-
-        if self._src_is_valid_mobject_handle():
+        if self._source_is_valid:
             md.reparentNode(self._source_mobj, parent)
-            md.doIt()
+            if do_it:
+                self._do_it(md)
 
         else:
             raise
 
-    def rename(self, name):
+    def rename(self, name, md=None):
+        # type: (str, om2.MDagModifier) -> None
 
         root = self._result_mobj.object()
-        md = om2.MDagModifier()
+        do_it = md is None
+        md = om2.MDagModifier() if do_it else md
 
-        if self._src_is_valid_mobject_handle():
+        if self._source_is_valid:
             md.renameNode(root, name)
-            md.doIt()
+            if do_it:
+                self._do_it(md)
 
         else:
             raise
 
-    def _src_is_valid_mobject_handle(self):
-        handle = self.source_mobjhandle
+    def _do_it(self, md):
+        # type: (om2.MDagModifier) -> None
+        md.doIt()
+        self._source_is_valid = self._validate_source()
+
+    def _validate_source(self):
+        # type: () -> bool
+        handle = self._source_mobjhandle
         return bool(handle.isValid() and handle.isAlive())
 
     @property
@@ -90,18 +106,18 @@ class HierarchyDuplicator(object):
     @property
     def source_mobjhandle(self):
         # type: () -> om2.MObjectHandle
-        return om2.MObjectHandle(dg_utils.as_mObject(self._source_path))
+        return self._source_mobjhandle
 
     @property
     def _source_mobj(self):
         # type: () -> om2.MObject
-        assert self._src_is_valid_mobject_handle()
-        return self.source_mobjhandle.object()
+        assert self._source_is_valid
+        return self._source_mobjhandle.object()
 
     @property
     def _source_dagpath(self,):
         # type: () -> om2.MDagPath
-        return dg_utils.as_mObject(self._source_mobj, 'getDagPath')
+        return om2.MDagPath.getAPathTo(self._source_mobj)
 
     @property
     def destination_path(self):
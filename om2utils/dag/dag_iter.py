@@ -6,20 +6,17 @@ no performance issues.
 
 import itertools
 import logging
-import pprint
 
 
-import maya.cmds as mc
 from maya.api import OpenMaya as om2
 
 from ..dg import dg_utils
 
 
 logger = logging.getLogger(__name__)
-_pf = pprint.PrettyPrinter(indent=4).pformat
 
 try:
-    from typing import Callable, Dict, Generator, Iterable, List, Union
+    from typing import Callable, Dict, FrozenSet, Generator, Iterable, List, Union
 except:
     pass
 
@@ -54,10 +51,12 @@ def idag(root=None, getter='currentItem', filter_type=om2.MFn.kInvalid):
     mit.reset(root or mit.root(), traversal_type, filter_type)
 
     accessor = getattr(mit, getter)
+    is_done = mit.isDone
+    advance = mit.next
 
-    while not mit.isDone():
+    while not is_done():
         yield accessor()
-        mit.next()
+        advance()
 
 
 def itransforms_under_root(root=None, **kwargs):
@@ -96,10 +95,13 @@ def itransformed_local_pivots(transforms):
         [u'|pCube3']
 
     """
-    mdag = om2.MFnDagNode()
+    mtrans = om2.MFnTransform()
+    space = om2.MSpace.kTransform
+    origin = om2.MPoint.kOrigin
 
-    mobj_path = lambda mobj:  mdag.setObject(mobj).fullPathName()
-    local_space = lambda mobj: any(mc.xform(mobj_path, piv=True, q=True))
+    def local_space(mobj):
+        mtrans.setObject(mobj)
+        return mtrans.rotatePivot(space) != origin or mtrans.scalePivot(space) != origin
 
     for transform in itertools.ifilter(local_space, transforms):
         yield transform
@@ -109,7 +111,17 @@ def _itransforms_of_identity(transforms, filter_func):
     # type: (Iterable[om2.MObject], Callable) -> Generator[om2.MObject]
 
     mtrans = om2.MFnTransform()
-    identity = lambda mobj: mtrans.setObject(mobj).transformationMatrix().isEquivalent(om2.MMatrix.kIdentity)
+    identity_mtx = om2.MMatrix.kIdentity
+    tolerance = om2.MMatrix.kTolerance
+
+    def identity(mobj):
+        mtx = mtrans.setObject(mobj).transformationMatrix()
+
+        # Translation is the most common non-identity component, reject on it before the full comparison.
+        if abs(mtx[12]) > tolerance or abs(mtx[13]) > tolerance or abs(mtx[14]) > tolerance:
+            return False
+
+        return mtx.isEquivalent(identity_mtx, tolerance)
 
     return (t for t in filter_func(identity, transforms))
 
@@ -180,18 +192,31 @@ class IMeshs(object):
 
         root = dg_utils.as_mObject(node_name)
         shape_paths = idag(root, getter='getPath', filter_type=om2.MFn.kShape)
-        transform_paths = (path.pop().node() for path in shape_paths)
+        transform_paths = (path.transform() for path in shape_paths)
 
         return transform_paths
 
 
 class IDag(object):
 
-    _omTypeMap = {getattr(om2.MFn, n): n for n in dir(om2.MFn)}
+    # Built on first use by `_omTypes()`, avoids querying every om2.MFn constant at import time.
+    _omTypeMap = None
+    _omTypeInts = None
 
-    _omTypeInts = [i for i in _omTypeMap.iterkeys()]
-    _omTypeStrs = [n for n in _omTypeMap.iteritems()]
-    _omTypeIntToType = lambda i: IDag._omTypeMap[i]
+    @classmethod
+    def _omTypes(cls):
+        # type: () -> FrozenSet[int]
+        if cls._omTypeMap is None:
+            cls._omTypeMap = {getattr(om2.MFn, n): n for n in dir(om2.MFn) if n.startswith('k')}
+            cls._omTypeInts = frozenset(cls._omTypeMap)
+
+        return cls._omTypeInts
+
+    @classmethod
+    def _omTypeIntToType(cls, i):
+        # type: (int) -> str
+        cls._omTypes()
+        return cls._omTypeMap[i]
 
     def __init__(self, root=None, *args, **kwargs):
         # type: (Union[str, om2.MObject , om2.MFn], List, Dict) -> None
@@ -224,27 +249,31 @@ class IDag(object):
             mit.reset(mItr, root, traversal_type)
 
         accessor = getattr(mit, self._getter)
+        is_done = mit.isDone
+        advance = mit.next
+        depth = mit.depth
+        yield_only_at_depth = self._yield_only_at_depth
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        # logger.debug('root: "{}"'.format(dg_utils.get_fullpath(root)))
-        # logger.debug('IDag.doIt() - locals()\n{}'.format(_pf(locals())))
-
-        while not mit.isDone():
-            logger.debug('@depth: {}, {}'.format(mit.depth(), mit.fullPathName()))
+        while not is_done():
+            if debug:
+                logger.debug('@depth: %s, %s', depth(), mit.fullPathName())
 
             # Handle if traversal of tree has depth limit.
-            if limit and mit.depth() >= limit:
-                logger.debug('Traversal depth limit ({}) reached for "{}"'
-                             .format(limit - 1, dg_utils.get_fullpath(self._root)))
+            if limit and depth() >= limit:
+                if debug:
+                    logger.debug('Traversal depth limit (%s) reached for "%s"',
+                                 limit - 1, dg_utils.get_fullpath(self._root))
                 break
 
             # Handle if yielding node at a specified depth.
-            if self._yield_only_at_depth and mit.depth() < self._yield_only_at_depth:
-                mit.next()
+            if yield_only_at_depth and depth() < yield_only_at_depth:
+                advance()
                 continue
 
             # Finally yield the node.
             yield accessor()
-            mit.next()
+            advance()
 
     @property
     def root(self):
@@ -276,7 +305,8 @@ class IDag(object):
         # type: (Iterable[om2.MFn]) -> None
         assert isinstance(values, list)
         msg = 'Provided "filter_types" are invalid, "{}"'.format(values)
-        assert all(lambda v: v in IDag._omTypeInts for v in values), msg
+        om_types = IDag._omTypes()
+        assert all(v in om_types for v in values), msg
 
         self._filter_types = values
 
@@ -1,10 +1,11 @@
 import logging
 from functools import partial
 
-from ..dg import dg_utils
-
+import maya.cmds as mc
 from maya.api import OpenMaya as om2
 
+from ..dg import dg_utils
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,22 +58,29 @@ def create_parent_above(mobj, name=None):
 def create_node_at_path(path):
     # type: (str) -> om2.MObject
 
-    from AL.maya import cmds
-
     # mtrans = om2.MFnTransform(om2.MObject.kNullObj)
     # new_parent = mtrans.createNode(name=nn, parent='|'.join(path_steps))
 
-    path_steps = ['']
-    last_node = ''
+    node_names = path.split('|')[1:]
+    path_steps = []
+    running = ''
+
+    for nn in node_names:
+        running = running + '|' + nn
+        path_steps.append(running)
 
-    for ii, nn in enumerate(path.split('|')[:]):
+    # Query all the levels of the path in one go, only the missing tail needs to be created.
+    existing = set(mc.ls(path_steps, long=True) or [])
 
-        if ii == 0:
+    for ii, nn in enumerate(node_names):
+
+        if path_steps[ii] in existing:
             continue
 
-        if not cmds.objExists('|'.join(path_steps + [nn])):
-            last_node = cmds.createNode('transform', name=nn,
-                                        parent='|'.join(path_steps))
-        path_steps.append(nn)
+        if ii:
+            mc.createNode('transform', name=nn, parent=path_steps[ii - 1])
+
+        else:
+            mc.createNode('transform', name=nn)
 
-    return dg_utils.as_mObject(last_node)
+    return dg_utils.as_mObject(path_steps[-1])
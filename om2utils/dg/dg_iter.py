@@ -0,0 +1,38 @@
+"""This module contains utilities for iterating over the maya DG.
+
+Prefer these over the DAG iterators when the order and depth of the nodes is irrelevant, as walking the flat node
+table skips all the DAG path bookkeeping.
+"""
+
+from maya.api import OpenMaya as om2
+
+try:
+    from typing import Generator
+except:
+    pass
+
+
+def idg_nodes(filter_type=om2.MFn.kInvalid):
+    # type: (om2.MFn) -> Generator[om2.MObject]
+    """Iterate over all the nodes of the maya DG.
+
+    Examples:
+        >>> # iterate on all transforms (MObjects) on the scene
+        >>> for mobj in idg_nodes(om2.MFn.kTransform):
+        ...     print(mobj)
+
+    Args:
+        filter_type: Filters the iterator to a specific type node. Defaults to om2.MFn.kInvalid (access all DG).
+
+    Yields:
+        MObject: the current node on the DG iteration.
+    """
+    mit = om2.MItDependencyNodes(filter_type)
+
+    this_node = mit.thisNode
+    is_done = mit.isDone
+    advance = mit.next
+
+    while not is_done():
+        yield this_node()
+        advance()
@@ -1,14 +1,11 @@
 import logging
-import pprint
 
 from maya.api import OpenMaya as om2
 
-from ..dag import dag_iter
-from . import dg_utils
+from . import dg_iter, dg_utils
 
 
 logger = logging.getLogger(__name__)
-_pf = pprint.PrettyPrinter(indent=4).pformat
 
 try:
     from typing import Iterable, Union
@@ -16,22 +13,36 @@ except:
     pass
 
 
+def _apply_plug_values(mdg, plug_name):
+    # type: (om2.MDGModifier, str) -> None
+    """Apply all the queued plug values of `mdg` with a single `doIt()` call.
+
+    The modifier is not issued from a command, so the edits are not added to Maya's undo queue.
+
+    """
+    try:
+        mdg.doIt()
+
+    except RuntimeError as err:
+        logger.error('Could not set "%s" values\n Reason:\n%s', plug_name, err)
+
+
 # TODO: Implement behaviour to lookup the value type to infer the setter method.
 def _set_plug_value(mobjs, plug_name, plug_value):
     # type: (Iterable[Union[str, om2.MDagPath, om2.MObject]], str, any) -> None
 
     dep_node = om2.MFnDependencyNode()
+    mdg = om2.MDGModifier()
+
+    for mobj in mobjs:
 
-    for mobj in map(dg_utils.as_mObject, mobjs):
+        if not isinstance(mobj, om2.MObject):
+            mobj = dg_utils.as_mObject(mobj)
 
         node_plug = dep_node.setObject(mobj).findPlug(plug_name, False)
-        try:
-            node_plug.setBool(plug_value)
+        mdg.newPlugValueBool(node_plug, plug_value)
 
-        except RuntimeError as err:
-            node_plug_ = node_plug.name().split('|')[-1]
-            msg = 'Could not set "{node_plug_}"\n Reason:\n{err}'
-            logger.error(msg.format(**locals()))
+    _apply_plug_values(mdg, plug_name)
 
 
 def _set_visibility(mobjs, show_nodes=None):
@@ -41,41 +52,44 @@ def _set_visibility(mobjs, show_nodes=None):
 
     nodes_to_show = set(show_nodes or [])
     dep_node = om2.MFnDependencyNode()
+    mdg = om2.MDGModifier()
+
+    # `visibility` is inherited from dagNode, so the same attribute builds the plug on every node.
+    attr = om2.MNodeClass('dagNode').attribute(attr_name)
 
+    debug = logger.isEnabledFor(logging.DEBUG)
     msg_ = []
 
     for mobj in mobjs:
 
         dep_node.setObject(mobj)
-        node_plug = dep_node.findPlug(attr_name, False)
-        node_sn = dg_utils.get_shortname(node_plug.name().split('.')[0])
+        node_plug = om2.MPlug(mobj, attr)
+        node_sn = dg_utils.get_shortname(dep_node.name())
 
         choice = bool(node_sn in nodes_to_show)
         # TODO: improve handling to be more explicit for values that can't be changed.
-        try:
-            node_plug.setBool(choice)
+        mdg.newPlugValueBool(node_plug, choice)
 
-        except RuntimeError as err:
-            node_plug_ = node_plug.name().split('|')[-1]
-            err_msg = 'Could not set "{node_plug_}"\n Reason:\n{err}'
-            logger.error(err_msg.format(**locals()))
+        if debug:
+            msg_.append('{v} : {p}.{a}'.format(
+                p=om2.MDagPath.getAPathTo(mobj).fullPathName(),
+                a=attr_name, v=choice)
+            )
 
-        msg_.append('{v} : {p}.{a}'.format(
-            p=om2.MDagPath.getAPathTo(mobj).fullPathName(),
-            a=attr_name, v=choice)
-        )
+    _apply_plug_values(mdg, attr_name)
 
-    print _pf(msg_)
+    if debug:
+        logger.debug('\n'.join(msg_))
 
 
 def set_visibility_all_transforms(value):
     # type: (bool) -> None
-    _set_plug_value(dag_iter.itransforms(), 'visibility', value)
+    _set_plug_value(dg_iter.idg_nodes(om2.MFn.kTransform), 'visibility', value)
 
 
 def set_visibility_all_meshs(value):
     # type: (bool) -> None
-    _set_plug_value(dag_iter.IMeshs.iter(), 'visibility', value)
+    _set_plug_value(dg_iter.idg_nodes(om2.MFn.kMesh), 'visibility', value)
 
 
 # def set_visibility_by_fullpath(mobjs, show_nodes=None):
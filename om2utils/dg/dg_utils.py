@@ -35,6 +35,35 @@ def as_mObject(obj, getter='getDependNode'):
     return mobj
 
 
+def _dependency_node_name(mobj):
+    # type: (om2.MObject) -> Union[str, None]
+    """Returns the name of `mobj`, or None if it is not a dependency node (null object, attribute, etc)."""
+    if mobj.hasFn(om2.MFn.kDependencyNode):
+        return om2.MFnDependencyNode(mobj).name()
+
+
+def _mobject_fullpath(mobj):
+    # type: (om2.MObject) -> Union[str, None]
+    if mobj.hasFn(om2.MFn.kDagNode):
+        return om2.MDagPath.getAPathTo(mobj).fullPathName()
+
+    return _dependency_node_name(mobj)
+
+
+# Fast paths keyed on the exact type of the most common inputs, subclasses fall back to the isinstance checks.
+_NAME_GETTERS = {
+    str: lambda obj: obj,
+    unicode: lambda obj: obj,
+    om2.MDagPath: om2.MDagPath.fullPathName,
+    om2.MObject: _dependency_node_name,
+}
+
+_FULLPATH_GETTERS = {
+    om2.MDagPath: om2.MDagPath.fullPathName,
+    om2.MObject: _mobject_fullpath,
+}
+
+
 def get_shortname(obj):
     # type: (Union[str, om2.MDagPath, om2.MObject]) -> str
     """Returns the shortest name of an object in the maya graph 
@@ -42,17 +71,21 @@ def get_shortname(obj):
 
     """
     valid_types = [str, om2.MDagPath, om2.MObject]
+    name_getter = _NAME_GETTERS.get(type(obj))
 
-    if isinstance(obj, basestring):
+    if name_getter is not None:
+        fullpath = name_getter(obj)
+
+    elif isinstance(obj, basestring):
         fullpath = obj
 
     elif isinstance(obj, om2.MDagPath):
         fullpath = obj.fullPathName()
 
-    elif obj.hasFn(om2.MFn.kDependencyNode):
-        fullpath = om2.MFnDependencyNode(obj).name()
+    else:
+        fullpath = _dependency_node_name(obj)
 
-    else:  # obj is not of a valid type.
+    if fullpath is None:  # obj is not of a valid type.
         msg = ('Provided object is invalid, object type is "{}".'
                ' Valid types are: {}'.format(type(obj), valid_types))
         raise ValueError(msg)
@@ -64,8 +97,12 @@ def get_fullpath(mobj):
     # type: (om2.MObject) -> str
 
     valid_types = [om2.MObject, om2.MDagPath]
+    fullpath_getter = _FULLPATH_GETTERS.get(type(mobj))
+
+    if fullpath_getter is not None:
+        return fullpath_getter(mobj)
 
-    if isinstance(mobj, om2.MDagPath):
+    elif isinstance(mobj, om2.MDagPath):
         if mobj.hasFn(om2.MFn.kDagNode):
             return mobj.fullPathName()
 